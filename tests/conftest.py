@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
-from copy import copy as copy_object
+from functools import cache, lru_cache
 from os import PathLike, symlink
 from pathlib import Path
 from shutil import copy, copytree
@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING, Literal, cast, final, overload
 
 from lxml.etree import (
     XML,
+    XMLParser,
+    XPath,
     _Element,  # pyright: ignore[reportPrivateUsage]
 )
 from pytest import ExitCode, FixtureRequest, Function, Pytester, RunResult, fixture
@@ -17,11 +19,7 @@ from typing_extensions import TypeGuard, override
 
 if TYPE_CHECKING:
     from _typeshed import StrPath
-    from lxml.etree import (
-        _AnyStr,  # pyright: ignore[reportPrivateUsage]
-        _NonDefaultNSMapArg,  # pyright: ignore[reportPrivateUsage]
-        _XPathObject,  # pyright: ignore[reportPrivateUsage]
-    )
+    from lxml.etree import _XPathObject  # pyright: ignore[reportPrivateUsage]
     from typing_extensions import Never
 
 # needed for fixtures that depend on other fixtures
@@ -40,36 +38,50 @@ def try_symlink(src: StrPath, dest: StrPath):
         copy(src, dest)
 
 
+@fixture(scope="session")
+def fixture_files() -> dict[str, dict[str, Path]]:
+    """the contents of each `tests/fixtures/[test file]` folder, keyed by file name. this is only
+    read once per session so that `pytester_dir` doesn't have to hit the file system for every test
+    """
+    return {
+        test_file_fixture_dir.name: {
+            fixture.name: fixture for fixture in test_file_fixture_dir.iterdir()
+        }
+        for test_file_fixture_dir in (Path(__file__).parent / "fixtures").iterdir()
+        if test_file_fixture_dir.is_dir()
+    }
+
+
 @fixture
-def pytester_dir(pytester: Pytester, request: FixtureRequest) -> PytesterDir:
+def pytester_dir(
+    pytester: Pytester, request: FixtureRequest, fixture_files: dict[str, dict[str, Path]]
+) -> PytesterDir:
     """wrapper for pytester that moves the files located in
     `tests/fixtures/[test file]/[test name].py` to the pytester temp dir for the current test, so
     you don't have to write your test files as strings with the `makefile`/`makepyfile` methods
     """
     test = cast(Function, request.node)
     test_name = test.originalname
-    fixtures_folder = Path(__file__).parent / "fixtures"
-    test_file_fixture_dir = (
-        fixtures_folder
-        / Path(cast(str, cast(ModuleType, test.module).__file__))
+    test_file_fixtures = fixture_files.get(
+        Path(cast(str, cast(ModuleType, test.module).__file__))
         .relative_to(Path(__file__).parent)
         .stem
     )
-    fixture_dir_for_current_test = test_file_fixture_dir / test_name
-    if fixture_dir_for_current_test.exists():
-        copytree(
-            fixture_dir_for_current_test,
-            pytester.path,
-            dirs_exist_ok=True,
-            copy_function=try_symlink,
-        )
-    elif test_file_fixture_dir.exists():
-        for file in (test_file_fixture_dir / f"{test_name}.{ext}" for ext in ("py", "robot")):
-            if file.exists():
-                try_symlink(file, pytester.path / file.name)
-                break
+    if test_file_fixtures is not None:
+        if test_name in test_file_fixtures:
+            copytree(
+                test_file_fixtures[test_name],
+                pytester.path,
+                dirs_exist_ok=True,
+                copy_function=try_symlink,
+            )
         else:
-            raise Exception(f"no fixtures found for {test_name=}")
+            for file_name in (f"{test_name}.{ext}" for ext in ("py", "robot")):
+                if file_name in test_file_fixtures:
+                    try_symlink(test_file_fixtures[file_name], pytester.path / file_name)
+                    break
+            else:
+                raise Exception(f"no fixtures found for {test_name=}")
     return cast(PytesterDir, pytester)
 
 
@@ -134,6 +146,13 @@ def _is_element_list(xpath_object: _XPathObject) -> TypeGuard[list[_Element]]:
     return result
 
 
+@cache
+def _compile_xpath(path: str) -> XPath:
+    """the same queries get run against many different `output.xml` files, so we only want to pay
+    the cost of compiling each one once"""
+    return XPath(path)
+
+
 @final
 class _XmlElement(Iterable["_XmlElement"]):
     def __init__(self, element: _Element) -> None:
@@ -142,7 +161,7 @@ class _XmlElement(Iterable["_XmlElement"]):
 
     @override
     def __getattribute__(self, /, name: str) -> object:
-        if _is_dunder(name) or name not in vars(_Element):
+        if _is_dunder(name) or name not in vars(_Element) or name in vars(_XmlElement):
             return super().__getattribute__(name)  # pyright:ignore[reportAny]
         return getattr(self._proxied, name)  # pyright:ignore[reportAny]
 
@@ -160,15 +179,8 @@ class _XmlElement(Iterable["_XmlElement"]):
         for element in self._proxied:
             yield _XmlElement(element)
 
-    def xpath(
-        self,
-        _path: _AnyStr,
-        namespaces: _NonDefaultNSMapArg | None = ...,
-        extensions: object = ...,
-        smart_strings: bool = ...,  # noqa:FBT001
-        **_variables: _XPathObject,
-    ) -> _XPathObject:
-        result = self._proxied.xpath(_path, namespaces, extensions, smart_strings, **_variables)
+    def xpath(self, _path: str, **_variables: _XPathObject) -> _XPathObject:
+        result = _compile_xpath(_path)(self._proxied, **_variables)
         if _is_element_list(result):
             # variance moment, but we aren't storing the value anywhere so it's fine
             return [_XmlElement(element) for element in result]  # pyright:ignore[reportReturnType]
@@ -194,29 +206,66 @@ if TYPE_CHECKING:
             """normally this returns how many children it has. but if you want to check than then
             call `count_children` instead"""
 
+        # queries are compiled once and cached, so lxml's `namespaces`, `extensions` and
+        # `smart_strings` arguments aren't supported
+        @override
+        def xpath(  # pyright:ignore[reportIncompatibleMethodOverride]
+            self, _path: str, **_variables: _XPathObject
+        ) -> _XPathObject: ...
+
         def count_children(self) -> int: ...
 
 else:
     XmlElement = _XmlElement
 
 
+# output.xml doesn't use ids or entities, and the whitespace between elements is just formatting
+_output_xml_parser = XMLParser(
+    collect_ids=False, remove_blank_text=True, resolve_entities=False, huge_tree=False
+)
+
+
+@lru_cache(maxsize=128)
+def _parse_output_xml(output_xml_path: Path, _mtime_ns: int) -> _Element:
+    """`_mtime_ns` is only used as part of the cache key, so that the file gets re-parsed if it was
+    re-generated by another pytest run in the same test"""
+    return XML(output_xml_path.read_bytes(), _output_xml_parser)
+
+
+def _output_xml_root() -> _Element:
+    output_xml_path = Path("output.xml").resolve()
+    return _parse_output_xml(output_xml_path, output_xml_path.stat().st_mtime_ns)
+
+
 def output_xml() -> XmlElement:
-    return XmlElement(XML(Path("output.xml").read_bytes()))
+    return XmlElement(_output_xml_root())
 
 
-def xpath(xml: _Element, query: str) -> XmlElement:
-    results = xml.xpath(query)
+def xpath(xml: XmlElement, query: str, **variables: _XPathObject) -> XmlElement:
+    """`variables` are bound to `$name` references in the query, so that queries built in a loop
+    reuse the same compiled xpath instead of formatting a new expression each time"""
+    results = xml.xpath(query, **variables)
     assert isinstance(results, list)
     (result,) = results
-    assert isinstance(result, _Element)
-    return XmlElement(result)
+    assert isinstance(result, XmlElement)
+    return result
+
+
+def exists(xml: XmlElement, path: str, **variables: _XPathObject) -> bool:
+    """checks whether `path` matches anything. the query is wrapped in xpath's `boolean()` so lxml
+    returns a `bool` instead of building a list of every matching element"""
+    result = xml.xpath(f"boolean({path})", **variables)
+    assert isinstance(result, bool)
+    return result
+
+
+_total_stat_xpath = XPath("./statistics/total/stat[1]")
 
 
 def assert_robot_total_stats(*, passed: int = 0, skipped: int = 0, failed: int = 0):
-    root = output_xml()
-    statistics = next(child for child in root if child.tag == "statistics")
-    total = next(child for child in statistics if child.tag == "total")
-    result = copy_object(next(child for child in total if child.tag == "stat").attrib)
+    stats = _total_stat_xpath(_output_xml_root())
+    assert _is_element_list(stats)
+    result = dict(stats[0].attrib)
     assert result == {"pass": str(passed), "fail": str(failed), "skip": str(skipped)}
 
 
@@ -240,7 +289,9 @@ class PytestRobotTester:
         # far from perfect but we can be reasonably confident that the xdist stuff ran if this
         # folder exists
         if check_xdist or not self.xdist:
-            assert bool(self.xdist) == bool(list(self.pytester.path.glob("**/robot_xdist_outputs")))
+            assert bool(self.xdist) == (
+                next(self.pytester.path.glob("**/robot_xdist_outputs"), None) is not None
+            )
 
     @overload
     def run_and_assert_assert_pytest_result(
@@ -3,20 +3,13 @@ from __future__ import annotations
 import re
 import sys
 from pathlib import Path
-from re import search
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 from _pytest.assertion.util import running_on_ci
 from pytest import ExitCode, MonkeyPatch, skip
 
 from pytest_robotframework._internal.robot.utils import robot_6
-from tests.conftest import (
-    PytestRobotTester,
-    XmlElement,
-    assert_robot_total_stats,
-    output_xml,
-    xpath,
-)
+from tests.conftest import PytestRobotTester, assert_robot_total_stats, exists, output_xml, xpath
 
 if TYPE_CHECKING:
     from tests.conftest import PytesterDir
@@ -35,9 +28,10 @@ def test_one_test_fails(pr: PytestRobotTester):
 def test_one_test_skipped(pr: PytestRobotTester):
     pr.run_and_assert_result(skipped=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
+    assert exists(
+        output_xml(),
         "./suite//test[@name='test_one_test_skipped']/kw[@type='SETUP']/msg[@level='SKIP' and "
-        ".='Skipped: foo']"
+        ".='Skipped: foo']",
     )
 
 
@@ -64,8 +58,9 @@ def test_two_tests_with_same_name_one_fail_one_pass(pr: PytestRobotTester):
 def test_suites(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
-        "./suite/suite[@name='Suite1']/suite[@name='Test Asdf']/test[@name='test_func1']"
+    assert exists(
+        output_xml(),
+        "./suite/suite[@name='Suite1']/suite[@name='Test Asdf']/test[@name='test_func1']",
     )
 
 
@@ -73,15 +68,17 @@ def test_nested_suites(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=2, failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         "./suite/suite[@name='Suite1']/suite[@name='Suite2']/suite[@name='Test"
-        " Asdf']/test[@name='test_func1']"
+        " Asdf']/test[@name='test_func1']",
     )
-    assert xml.xpath(
+    assert exists(
+        xml,
         "./suite/suite[@name='Suite1']/suite[@name='Suite3']/suite[@name='Test"
-        " Asdf2']/test[@name='test_func2']"
+        " Asdf2']/test[@name='test_func2']",
     )
-    assert xml.xpath("./suite/suite[@name='Test Top Level']/test[@name='test_func1']")
+    assert exists(xml, "./suite/suite[@name='Test Top Level']/test[@name='test_func1']")
 
 
 def test_robot_options_variable(pr: PytestRobotTester, monkeypatch: MonkeyPatch):
@@ -99,7 +96,7 @@ def test_robot_options_merge_listeners(pr: PytestRobotTester):
 
 
 def test_listener_not_run_during_collection(pr: PytestRobotTester):
-    pr.run_and_assert_assert_pytest_result("--collect-only", subprocess=True)
+    pr.run_and_assert_assert_pytest_result("--collect-only", subprocess=False)
     pr.assert_log_file_doesnt_exist()
 
 
@@ -130,20 +127,20 @@ def test_listener_calls_log_file(pr: PytestRobotTester):
 
 
 def test_doesnt_run_when_collecting(pr: PytestRobotTester):
-    pr.run_and_assert_assert_pytest_result("--collect-only", subprocess=True)
+    pr.run_and_assert_assert_pytest_result("--collect-only", subprocess=False)
     pr.assert_log_file_doesnt_exist()
 
 
 # TODO: this test doesnt actually test anything
 # https://github.com/DetachHead/pytest-robotframework/issues/61
 def test_collect_only_nested_suites(pr: PytestRobotTester):
-    result = pr.run_pytest("--collect-only", subprocess=True)
+    result = pr.run_pytest("--collect-only", subprocess=False)
     assert result.parseoutcomes() == {"tests": 2}
     assert "<Function test_func2>" in (line.strip() for line in result.outlines)
 
 
 def test_correct_items_collected_when_collect_only(pr: PytestRobotTester):
-    result = pr.run_pytest("--collect-only", "test_bar.py", subprocess=True)
+    result = pr.run_pytest("--collect-only", "test_bar.py", subprocess=False)
     assert result.parseoutcomes() == {"test": 1}
     assert "<Function test_func2>" in (line.strip() for line in result.outlines)
 
@@ -152,49 +149,49 @@ def test_setup_passes(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Setup']/msg[@level='INFO' and .='2']")
-    assert xml.xpath(".//test/kw[@name='Run Test']/msg[@level='INFO' and .='1']")
+    assert exists(xml, ".//test/kw[@name='Setup']/msg[@level='INFO' and .='2']")
+    assert exists(xml, ".//test/kw[@name='Run Test']/msg[@level='INFO' and .='1']")
 
 
 def test_setup_fails(pr: PytestRobotTester):
     pr.run_and_assert_result(errors=1, exit_code=ExitCode.TESTS_FAILED)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Setup']/msg[@level='FAIL' and .='2']")
-    assert not xml.xpath(".//test/kw[@name='Run Test']")
+    assert exists(xml, ".//test/kw[@name='Setup']/msg[@level='FAIL' and .='2']")
+    assert not exists(xml, ".//test/kw[@name='Run Test']")
 
 
 def test_setup_skipped(pr: PytestRobotTester):
     pr.run_and_assert_result(skipped=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Setup']/msg[@level='SKIP']")
-    assert not xml.xpath(".//test/kw[@name='Run Test']")
+    assert exists(xml, ".//test/kw[@name='Setup']/msg[@level='SKIP']")
+    assert not exists(xml, ".//test/kw[@name='Run Test']")
 
 
 def test_teardown_passes(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Run Test']/msg[@level='INFO' and .='1']")
-    assert xml.xpath(".//test/kw[@name='Teardown']/msg[@level='INFO' and .='2']")
+    assert exists(xml, ".//test/kw[@name='Run Test']/msg[@level='INFO' and .='1']")
+    assert exists(xml, ".//test/kw[@name='Teardown']/msg[@level='INFO' and .='2']")
 
 
 def test_teardown_fails(pr: PytestRobotTester):
     pr.run_and_assert_assert_pytest_result(passed=1, errors=1, exit_code=ExitCode.TESTS_FAILED)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Run Test']")
-    assert xml.xpath(".//test/kw[@name='Teardown']/msg[@level='FAIL' and .='2']")
+    assert exists(xml, ".//test/kw[@name='Run Test']")
+    assert exists(xml, ".//test/kw[@name='Teardown']/msg[@level='FAIL' and .='2']")
 
 
 def test_error_moment(pr: PytestRobotTester):
     pr.run_and_assert_result(failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Run Test']/msg[@level='ERROR' and .='foo']")
+    assert exists(xml, ".//test/kw[@name='Run Test']/msg[@level='ERROR' and .='foo']")
     # make sure it didn't prevent the rest of the test from running
-    assert xml.xpath(".//test/kw[@name='Run Test']/msg[@level='INFO' and .='bar']")
+    assert exists(xml, ".//test/kw[@name='Run Test']/msg[@level='INFO' and .='bar']")
 
 
 def test_fixture_scope(pr: PytestRobotTester):
@@ -210,9 +207,9 @@ def test_error_moment_setup(pr: PytestRobotTester):
     pr.run_and_assert_result(errors=1, exit_code=ExitCode.TESTS_FAILED)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Setup']/msg[@level='ERROR' and .='foo']")
-    assert xml.xpath(".//test/kw[@name='Setup']/msg[@level='INFO' and .='bar']")
-    assert not xml.xpath(".//test/kw[@name='Run Test']")
+    assert exists(xml, ".//test/kw[@name='Setup']/msg[@level='ERROR' and .='foo']")
+    assert exists(xml, ".//test/kw[@name='Setup']/msg[@level='INFO' and .='bar']")
+    assert not exists(xml, ".//test/kw[@name='Run Test']")
 
 
 def test_error_moment_teardown(pr: PytestRobotTester):
@@ -221,23 +218,25 @@ def test_error_moment_teardown(pr: PytestRobotTester):
     assert_robot_total_stats(failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Run Test']/msg[@level='INFO' and .='baz']")
-    assert xml.xpath(".//test/kw[@name='Teardown']/msg[@level='ERROR' and .='foo']")
+    assert exists(xml, ".//test/kw[@name='Run Test']/msg[@level='INFO' and .='baz']")
+    assert exists(xml, ".//test/kw[@name='Teardown']/msg[@level='ERROR' and .='foo']")
     # make sure it didn't prevent the rest of the test from running
-    assert xml.xpath(".//test/kw[@name='Teardown']/msg[@level='INFO' and .='bar']")
+    assert exists(xml, ".//test/kw[@name='Teardown']/msg[@level='INFO' and .='bar']")
 
 
 def test_error_moment_and_second_test(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1, failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         ".//test[@name='test_foo' and ./status[@status='FAIL']]/kw[@name='Run"
-        " Test']/msg[@level='ERROR' and .='foo']"
+        " Test']/msg[@level='ERROR' and .='foo']",
     )
-    assert xml.xpath(
+    assert exists(
+        xml,
         ".//test[@name='test_bar' and ./status[@status='PASS']]/kw[@name='Run"
-        " Test']/msg[@level='INFO' and .='bar']"
+        " Test']/msg[@level='INFO' and .='bar']",
     )
 
 
@@ -245,9 +244,9 @@ def test_error_moment_exitonerror(pr: PytestRobotTester):
     pr.run_and_assert_result("--robot-exitonerror", failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Run Test']/msg[@level='ERROR' and .='foo']")
+    assert exists(xml, ".//test/kw[@name='Run Test']/msg[@level='ERROR' and .='foo']")
     # make sure it didn't prevent the rest of the test from running
-    assert xml.xpath(".//test/kw[@name='Run Test']/msg[@level='INFO' and .='bar']")
+    assert exists(xml, ".//test/kw[@name='Run Test']/msg[@level='INFO' and .='bar']")
 
 
 def test_error_moment_exitonerror_multiple_tests(pr: PytestRobotTester):
@@ -260,16 +259,16 @@ def test_error_moment_exitonerror_multiple_tests(pr: PytestRobotTester):
         assert_robot_total_stats(failed=2)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         ".//test[@name='test_foo' and ./status[@status='FAIL']]/kw[@name='Run"
-        " Test']/msg[@level='ERROR' and .='foo']"
+        " Test']/msg[@level='ERROR' and .='foo']",
     )
     assert (
-        bool(
-            xml.xpath(
-                ".//test[@name='test_bar']/status[@status='FAIL' and .='Error occurred"
-                " and exit-on-error mode is in use.']"
-            )
+        exists(
+            xml,
+            ".//test[@name='test_bar']/status[@status='FAIL' and .='Error occurred"
+            " and exit-on-error mode is in use.']",
         )
         != pr.xdist
     )
@@ -283,8 +282,8 @@ def test_teardown_skipped(pr: PytestRobotTester):
     assert_robot_total_stats(skipped=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test/kw[@name='Run Test']")
-    assert xml.xpath(".//test/kw[@name='Teardown']/msg[@level='SKIP']")
+    assert exists(xml, ".//test/kw[@name='Run Test']")
+    assert exists(xml, ".//test/kw[@name='Teardown']/msg[@level='SKIP']")
 
 
 def test_fixture(pr: PytestRobotTester):
@@ -295,46 +294,52 @@ def test_fixture(pr: PytestRobotTester):
 def test_module_docstring(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath("./suite/suite/doc[.='hello???']")
+    assert exists(output_xml(), "./suite/suite/doc[.='hello???']")
 
 
 def test_test_case_docstring(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath("./suite/suite/test/doc[.='hello???']")
+    assert exists(output_xml(), "./suite/suite/test/doc[.='hello???']")
 
 
 def test_keyword_decorator_docstring(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(".//kw[@name='Run Test']/kw[@name='Foo']/doc[.='hie']")
+    assert exists(
+        output_xml(), "./suite/suite/test/kw[@name='Run Test']/kw[@name='Foo']/doc[.='hie']"
+    )
 
 
 def test_keyword_decorator_docstring_on_next_line(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(".//kw[@name='Run Test']/kw[@name='Foo']/doc[.='hie']")
+    assert exists(
+        output_xml(), "./suite/suite/test/kw[@name='Run Test']/kw[@name='Foo']/doc[.='hie']"
+    )
 
 
 def test_keyword_decorator_args(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=2)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         ".//test[@name='test_no_truncation']//kw[@name='Run Test']/kw[@name='Foo' and ./arg[.='1']"
-        " and ./arg[.='bar=True']]"
+        " and ./arg[.='bar=True']]",
     )
-    assert xml.xpath(
+    assert exists(
+        xml,
         ".//test[@name='test_truncation']//kw[@name='Run Test']/kw[@name='Foo' and"
-        f" ./arg[.='{'a' * 50}...'] and ./arg[.='bar={'b' * 50}...']]"
+        f" ./arg[.='{'a' * 50}...'] and ./arg[.='bar={'b' * 50}...']]",
     )
 
 
 def test_keyword_decorator_custom_name_and_tags(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
-        ".//kw[@name='Run Test']/kw[@name='foo bar' and ./tag['a'] and ./tag['b']]"
+    assert exists(
+        output_xml(), ".//kw[@name='Run Test']/kw[@name='foo bar' and ./tag['a'] and ./tag['b']]"
     )
 
 
@@ -342,35 +347,36 @@ def test_keyword_decorator_context_manager_that_doesnt_suppress(pr: PytestRobotT
     pr.run_and_assert_result(failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("//kw[@name='Asdf']/msg[@level='INFO' and .='start']")
-    assert xml.xpath("//kw[@name='Asdf']/msg[@level='INFO' and .='0']")
-    assert xml.xpath("//kw[@name='Asdf']/msg[@level='INFO' and .='end']")
-    assert xml.xpath("//kw[@name='Asdf' and ./status[@status='FAIL'] and ./msg[.='Exception']]")
-    assert not xml.xpath("//msg[.='1']")
+    assert exists(xml, "//kw[@name='Asdf']/msg[@level='INFO' and .='start']")
+    assert exists(xml, "//kw[@name='Asdf']/msg[@level='INFO' and .='0']")
+    assert exists(xml, "//kw[@name='Asdf']/msg[@level='INFO' and .='end']")
+    assert exists(xml, "//kw[@name='Asdf' and ./status[@status='FAIL'] and ./msg[.='Exception']]")
+    assert not exists(xml, "//msg[.='1']")
 
 
 def test_keyword_decorator_context_manager_that_raises_in_exit(pr: PytestRobotTester):
     pr.run_and_assert_result(failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("//kw[@name='Asdf']/msg[@level='INFO' and .='start']")
-    assert xml.xpath("//kw[@name='Asdf']/msg[@level='INFO' and .='0']")
-    assert xml.xpath("//kw[@name='Asdf']/msg[@level='FAIL' and .='asdf']")
-    assert not xml.xpath("//msg[.='1']")
+    assert exists(xml, "//kw[@name='Asdf']/msg[@level='INFO' and .='start']")
+    assert exists(xml, "//kw[@name='Asdf']/msg[@level='INFO' and .='0']")
+    assert exists(xml, "//kw[@name='Asdf']/msg[@level='FAIL' and .='asdf']")
+    assert not exists(xml, "//msg[.='1']")
 
 
 def test_keyword_decorator_context_manager_that_raises_in_body_and_exit(pr: PytestRobotTester):
     pr.run_and_assert_result("--robot-loglevel", "DEBUG:INFO", failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("//kw[@name='Asdf']/msg[@level='INFO' and .='start']")
-    assert xml.xpath("//kw[@name='Asdf']/msg[@level='FAIL' and .='asdf']")
-    assert xml.xpath(
+    assert exists(xml, "//kw[@name='Asdf']/msg[@level='INFO' and .='start']")
+    assert exists(xml, "//kw[@name='Asdf']/msg[@level='FAIL' and .='asdf']")
+    assert exists(
+        xml,
         "//kw[@name='Asdf']/msg[@level='DEBUG' and contains(.,'Exception:"
         " fdsa\n\nDuring handling of the above exception, another exception"
-        " occurred:') and contains(., 'Exception: asdf')]"
+        " occurred:') and contains(., 'Exception: asdf')]",
     )
-    assert not xml.xpath("//msg[.='1']")
+    assert not exists(xml, "//msg[.='1']")
 
 
 def test_keyword_decorator_returns_context_manager_that_isnt_used(pr: PytestRobotTester):
@@ -382,34 +388,36 @@ def test_keyword_decorator_try_except(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         "//kw[@name='Run Test' and ./status[@status='PASS']]/kw[@name='Bar' and"
-        " ./status[@status='FAIL']]/msg[.='FooError']"
+        " ./status[@status='FAIL']]/msg[.='FooError']",
     )
-    assert xml.xpath("//kw[@name='Run Test']/msg[.='hi']")
+    assert exists(xml, "//kw[@name='Run Test']/msg[.='hi']")
 
 
 def test_keywordify_keyword_inside_context_manager(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//kw[@name='Raises' and ./arg[.=\"<class 'ZeroDivisionError'>\"]]/kw[@name='Asdf']"
+    assert exists(
+        xml, "//kw[@name='Raises' and ./arg[.=\"<class 'ZeroDivisionError'>\"]]/kw[@name='Asdf']"
     )
 
 
 def test_keywordify_function(pr: PytestRobotTester):
     pr.run_and_assert_result(failed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath("//kw[@name='Fail' and ./arg[.='asdf']]")
+    assert exists(output_xml(), "//kw[@name='Fail' and ./arg[.='asdf']]")
 
 
 def test_keywordify_context_manager(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
+    assert exists(
+        output_xml(),
         "//kw[@name='Raises' and ./arg[.=\"<class 'ZeroDivisionError'>\"] and"
-        " ./status[@status='PASS']]"
+        " ./status[@status='PASS']]",
     )
 
 
@@ -417,14 +425,14 @@ def test_tags(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test[@name='test_tags']/tag[.='slow']")
+    assert exists(xml, "./suite/suite/test[@name='test_tags']/tag[.='slow']")
 
 
 def test_parameterized_tags(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test[@name='test_tags']/tag[.='foo:bar']")
+    assert exists(xml, "./suite/suite/test[@name='test_tags']/tag[.='foo:bar']")
 
 
 def test_keyword_names(pr: PytestRobotTester):
@@ -432,9 +440,13 @@ def test_keyword_names(pr: PytestRobotTester):
     pr.assert_log_file_exists()
     xml = output_xml()
     for index in range(2):
-        assert xml.xpath(f".//test[@name='test_{index}']/kw[@name='Setup' and not(./arg)]")
-        assert xml.xpath(f".//test[@name='test_{index}']/kw[@name='Run Test' and not(./arg)]")
-        assert xml.xpath(f".//test[@name='test_{index}']/kw[@name='Teardown' and not(./arg)]")
+        for keyword in ("Setup", "Run Test", "Teardown"):
+            assert exists(
+                xml,
+                ".//test[@name=$test]/kw[@name=$keyword and not(./arg)]",
+                test=f"test_{index}",
+                keyword=keyword,
+            )
 
 
 def test_suite_variables(pr: PytestRobotTester):
@@ -461,8 +473,8 @@ def test_parametrize(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1, failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("//test[@name='test_eval[1-8]']")
-    assert xml.xpath("//test[@name='test_eval[6-6]']")
+    assert exists(xml, "./suite/suite/test[@name='test_eval[1-8]']")
+    assert exists(xml, "./suite/suite/test[@name='test_eval[6-6]']")
 
 
 def test_unittest_class(pr: PytestRobotTester):
@@ -478,28 +490,30 @@ def test_robot_keyword_in_python_test(pr: PytestRobotTester):
 def test_xfail_fails(pr: PytestRobotTester):
     pr.run_and_assert_result(xfailed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath("//kw[@name='Run Test' and ./msg[@level='SKIP' and .='xfail: asdf']]")
+    assert exists(
+        output_xml(), "//kw[@name='Run Test' and ./msg[@level='SKIP' and .='xfail: asdf']]"
+    )
 
 
 def test_xfail_passes(pr: PytestRobotTester):
     pr.run_and_assert_result(failed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
-        "//kw[@name='Run Test' and ./msg[@level='FAIL' and .='[XPASS(strict)] asdf']]"
+    assert exists(
+        output_xml(), "//kw[@name='Run Test' and ./msg[@level='FAIL' and .='[XPASS(strict)] asdf']]"
     )
 
 
 def test_xfail_fails_no_reason(pr: PytestRobotTester):
     pr.run_and_assert_result(xfailed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath("//kw[@name='Run Test' and ./msg[@level='SKIP' and .='xfail']]")
+    assert exists(output_xml(), "//kw[@name='Run Test' and ./msg[@level='SKIP' and .='xfail']]")
 
 
 def test_xfail_passes_no_reason(pr: PytestRobotTester):
     pr.run_and_assert_result(failed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
-        "//kw[@name='Run Test' and ./msg[@level='FAIL' and .='[XPASS(strict)] ']]"
+    assert exists(
+        output_xml(), "//kw[@name='Run Test' and ./msg[@level='FAIL' and .='[XPASS(strict)] ']]"
     )
 
 
@@ -520,15 +534,16 @@ def test_no_tests_found_when_tests_exist(pr: PytestRobotTester):
 def test_assertion_fails(pr: PytestRobotTester):
     pr.run_and_assert_result(failed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath("//msg[@level='FAIL' and .='assert 1 == 2']")
+    assert exists(output_xml(), "//msg[@level='FAIL' and .='assert 1 == 2']")
 
 
 def test_assertion_passes(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", subprocess=True, passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
+    assert exists(
+        output_xml(),
         "//kw[@name='assert' and ./arg[.='left == right'] and ./status[@status='PASS']]"
-        "/msg[@level='INFO' and .='1 == 1']"
+        "/msg[@level='INFO' and .='1 == 1']",
     )
 
 
@@ -536,36 +551,38 @@ def test_assertion_fails_with_assertion_hook(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         "//kw[@name='assert' and ./arg[.='left == right'] and ./status[@status='FAIL']]"
-        "/msg[@level='FAIL' and .='assert 1 == 2']"
+        "/msg[@level='FAIL' and .='assert 1 == 2']",
     )
     # make sure the error was only logged once , since the exception gets re-raised after the
     # keyword is over we want to make sure it's not printed multiple times
-    assert xpath(xml, "///msg[@level='FAIL']")
+    assert xpath(xml, "//msg[@level='FAIL']")
 
 
 def test_nested_keyword_that_fails(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", subprocess=True, failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("//kw[@name='Bar']/msg[@level='FAIL' and .='asdf']")
+    assert exists(xml, "//kw[@name='Bar']/msg[@level='FAIL' and .='asdf']")
     # make sure the error was only logged once , since the exception gets re-raised after the
     # keyword is over we want to make sure it's not printed multiple times
-    assert xpath(xml, "///msg[@level='FAIL']")
+    assert xpath(xml, "//msg[@level='FAIL']")
 
 
 def test_assertion_passes_hide_assert(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", subprocess=True, passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//kw[@name='assert' and ./arg[.='left == right']]/msg[@level='INFO' and .='1 == 1']"
+    assert exists(
+        xml, "//kw[@name='assert' and ./arg[.='left == right']]/msg[@level='INFO' and .='1 == 1']"
     )
-    assert not xml.xpath("//kw[@name='assert']/arg[.='right == left']")
-    assert xml.xpath(
+    assert not exists(xml, "//kw[@name='assert']/arg[.='right == left']")
+    assert exists(
+        xml,
         "//kw[@name='assert' and ./arg[.='right == right  # noqa: PLR0124']]/msg[@level='INFO' and "
-        ".='1 == 1']"
+        ".='1 == 1']",
     )
 
 
@@ -573,16 +590,18 @@ def test_assertion_passes_custom_messages(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", subprocess=True, failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//kw[@name='assert' and ./arg[.='left == right']]/msg[@level='INFO' and .='1 == 1']"
+    assert exists(
+        xml, "//kw[@name='assert' and ./arg[.='left == right']]/msg[@level='INFO' and .='1 == 1']"
     )
-    assert xml.xpath(
+    assert exists(
+        xml,
         "//kw[@name='assert' and ./arg[.='does appear1'] and ./msg[@level='INFO' and .='assert "
-        "right == left'] and ./msg[@level='INFO' and .='1 == 1']]"
+        "right == left'] and ./msg[@level='INFO' and .='1 == 1']]",
     )
-    assert xml.xpath(
+    assert exists(
+        xml,
         "//kw[@name='assert' and ./arg[.='right == \"wrong\"'] and ./msg[@level='FAIL' and .=\"does"
-        " appear2\nassert 1 == 'wrong'\"]]"
+        " appear2\nassert 1 == 'wrong'\"]]",
     )
 
 
@@ -596,12 +615,13 @@ def test_assertion_passes_show_assert_when_no_assertions_in_robot_log(pr: Pytest
     )
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//kw[@name='assert' and ./arg[.='left == right']]/msg[@level='INFO' and .='1 == 1']"
+    assert exists(
+        xml, "//kw[@name='assert' and ./arg[.='left == right']]/msg[@level='INFO' and .='1 == 1']"
     )
-    assert not xml.xpath("//kw[@name='assert']/arg[.='right == left']")
-    assert xml.xpath(
-        "//kw[@name='assert' and ./arg[.='right == right']]/msg[@level='INFO' and " + ".='1 == 1']"
+    assert not exists(xml, "//kw[@name='assert']/arg[.='right == left']")
+    assert exists(
+        xml,
+        "//kw[@name='assert' and ./arg[.='right == right']]/msg[@level='INFO' and " + ".='1 == 1']",
     )
 
 
@@ -609,9 +629,10 @@ def test_assertion_fails_with_fail_message_hide_assert(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", subprocess=True, failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         "//kw[@name='assert' and ./arg[.='right == \"wrong\"']]/msg[@level='FAIL' and "
-        ".=\"asdf\nassert 1 == 'wrong'\"]"
+        ".=\"asdf\nassert 1 == 'wrong'\"]",
     )
 
 
@@ -619,8 +640,9 @@ def test_assertion_fails_with_description(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", subprocess=True, failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//kw[@name='assert' and ./arg[.='asdf']]/msg[@level='FAIL' and .=\"assert 1 == 'wrong'\"]"
+    assert exists(
+        xml,
+        "//kw[@name='assert' and ./arg[.='asdf']]/msg[@level='FAIL' and .=\"assert 1 == 'wrong'\"]",
     )
 
 
@@ -628,10 +650,10 @@ def test_assertion_passes_hide_asserts_context_manager(pr: PytestRobotTester):
     pr.run_and_assert_result("-o", "enable_assertion_pass_hook=true", subprocess=True, passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("//kw[@name='assert']/arg[.='1']")
-    assert xml.xpath("//kw[@name='assert']/arg[.='right == left']")
-    assert xml.xpath("//kw[@name='assert']/arg[.='2']")
-    assert len(cast(list[XmlElement], xml.xpath("//kw[@name='assert']"))) == 3
+    assert exists(xml, "//kw[@name='assert']/arg[.='1']")
+    assert exists(xml, "//kw[@name='assert']/arg[.='right == left']")
+    assert exists(xml, "//kw[@name='assert']/arg[.='2']")
+    assert xml.xpath("count(//kw[@name='assert'])") == 3
 
 
 def test_assertion_pass_hook_multiple_tests(pr: PytestRobotTester):
@@ -645,25 +667,25 @@ def test_assertion_pass_hook_multiple_tests(pr: PytestRobotTester):
     )
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//kw[@name='assert' and ./arg['left == right']]/msg[@level='INFO' and .='1 == 1']"
+    assert exists(
+        xml, "//kw[@name='assert' and ./arg['left == right']]/msg[@level='INFO' and .='1 == 1']"
     )
-    assert xml.xpath(
-        "//kw[@name='assert' and ./arg['right == left']]/msg[@level='INFO' and .='1 == 1']"
+    assert exists(
+        xml, "//kw[@name='assert' and ./arg['right == left']]/msg[@level='INFO' and .='1 == 1']"
     )
 
 
 def test_keyword_and_pytest_raises(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath("//kw[@name='Raises']/kw[@name='Bar']/status[@status='FAIL']")
+    assert exists(output_xml(), "//kw[@name='Raises']/kw[@name='Bar']/status[@status='FAIL']")
 
 
 def test_keyword_raises(pr: PytestRobotTester):
     pr.run_and_assert_result(failed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
-        "//kw[@name='Bar' and ./status[@status='FAIL'] and ./msg[.='FooError']]"
+    assert exists(
+        output_xml(), "//kw[@name='Bar' and ./status[@status='FAIL'] and ./msg[.='FooError']]"
     )
 
 
@@ -671,24 +693,24 @@ def test_as_keyword_context_manager_try_except(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("//kw[@name='hi' and ./status[@status='FAIL']]/msg[.='FooError']")
-    assert xml.xpath("//kw[@name='Run Test']/msg[.='2']")
+    assert exists(xml, "//kw[@name='hi' and ./status[@status='FAIL']]/msg[.='FooError']")
+    assert exists(xml, "//kw[@name='Run Test']/msg[.='2']")
 
 
 def test_as_keyword_args_and_kwargs(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("//kw[@name='asdf']/arg[.='a']")
-    assert xml.xpath("//kw[@name='asdf']/arg[.='b']")
-    assert xml.xpath("//kw[@name='asdf']/arg[.='c=d']")
-    assert xml.xpath("//kw[@name='asdf']/arg[.='e=f']")
+    assert exists(xml, "//kw[@name='asdf']/arg[.='a']")
+    assert exists(xml, "//kw[@name='asdf']/arg[.='b']")
+    assert exists(xml, "//kw[@name='asdf']/arg[.='c=d']")
+    assert exists(xml, "//kw[@name='asdf']/arg[.='e=f']")
 
 
 def test_invalid_fixture(pr: PytestRobotTester):
     pr.run_and_assert_result(errors=1, exit_code=ExitCode.TESTS_FAILED)
     pr.assert_log_file_exists()
-    assert not output_xml().xpath("//*[contains(., 'Unknown exception type appeared')]")
+    assert not exists(output_xml(), "//*[contains(., 'Unknown exception type appeared')]")
 
 
 def test_pytest_runtest_protocol_session_hook(pr: PytestRobotTester):
@@ -721,8 +743,8 @@ def test_traceback(pr: PytestRobotTester):
     pr.run_and_assert_result("--robot-loglevel", "DEBUG:INFO", failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//msg[@level='DEBUG' and contains(., 'in test_foo') and contains(., 'in asdf')]"
+    assert exists(
+        xml, "//msg[@level='DEBUG' and contains(., 'in test_foo') and contains(., 'in asdf')]"
     )
 
 
@@ -757,7 +779,7 @@ def test_two_tests_specified_by_full_path_in_different_files(pr: PytestRobotTest
     # we don't know what order they will be in:
     assert xpath(xml, "/robot/suite[@name='Test Bar & Test Foo' or @name='Test Foo & Test Bar']")
     # make sure the metadata with the original suite names were deleted
-    assert not xml.xpath("//meta")
+    assert not exists(xml, "//meta")
 
 
 def test_assertion_rewritten_in_conftest_when_assertion_hook_enabled(pr: PytestRobotTester):
@@ -765,15 +787,13 @@ def test_assertion_rewritten_in_conftest_when_assertion_hook_enabled(pr: PytestR
     pr.assert_log_file_exists()
 
 
+_stack_trace_line = re.compile(r"\s+File \".*\", line (\d+), in (.*)")
+
+
 class TestStackTraces:
     @staticmethod
     def parse_stack_trace(stack: str) -> dict[int, str]:
-        result: dict[int, str] = {}
-        for line in stack.split("\n"):
-            match = search(r"\s+File \".*\", line (\d+), in (.*)", line)
-            if match:
-                result[int(match[1])] = match[2]
-        return result
+        return {int(match[1]): match[2] for match in _stack_trace_line.finditer(stack)}
 
     @classmethod
     def test_trace_ricing(cls, pr: PytestRobotTester):
@@ -822,7 +842,9 @@ def test_ansi(pr: PytestRobotTester):
         and contains(., 'span style="color: #5c5cff">2</span><span style="color: #7f7f7f"')
         ]""",
     ).text
-    assert xml.xpath("""//status[@status='FAIL' and .="\
+    assert exists(
+        xml,
+        """//status[@status='FAIL' and .="\
 assert [1, 2, 3] == [1, '<div>asdf</div>', 3]
   
   At index 1 diff: 2 != '<div>asdf</div>'
@@ -834,7 +856,8 @@ assert [1, 2, 3] == [1, '<div>asdf</div>', 3]
   +     2,
         3,
     ]"
-    ]""")
+    ]""",
+    )
 
 
 def test_set_log_level(pr: PytestRobotTester):
@@ -842,8 +865,8 @@ def test_set_log_level(pr: PytestRobotTester):
     pr.assert_log_file_exists()
     xml = output_xml()
     # on robot 6 this is logged as INFO and on robot 7 it's logged as DEBUG
-    assert xml.xpath("//msg[.='Log level changed from INFO to DEBUG.']")
-    assert xml.xpath("//msg[@level='DEBUG' and .='hello???']")
+    assert exists(xml, "//msg[.='Log level changed from INFO to DEBUG.']")
+    assert exists(xml, "//msg[@level='DEBUG' and .='hello???']")
 
 
 def test_class_has_separate_suite(pr: PytestRobotTester):
@@ -882,17 +905,19 @@ def test_class_separate_files(pr: PytestRobotTester):
     pr.assert_log_file_exists()
     xml = output_xml()
     for file_number in (1, 2):
-        top_level_suite = xpath(xml, f"//suite[@name='Test Suite{file_number}']")
+        top_level_suite = xpath(xml, "//suite[@name=$name]", name=f"Test Suite{file_number}")
         assert top_level_suite.count_children() == 3  # suite, test, status
-        assert xpath(top_level_suite, f"./test[@name='test_foo{file_number}']")
+        assert xpath(top_level_suite, "./test[@name=$name]", name=f"test_foo{file_number}")
 
-        class_suite = xpath(top_level_suite, f"./suite[@name='TestClass{file_number}']")
+        class_suite = xpath(top_level_suite, "./suite[@name=$name]", name=f"TestClass{file_number}")
         assert class_suite.count_children() == 2  # test and status
-        assert xpath(class_suite, f"./test[@name='test_bar{file_number}']")
+        assert xpath(class_suite, "./test[@name=$name]", name=f"test_bar{file_number}")
 
 
 def test_python_file_doesnt_get_parsed_as_robot_file(pr: PytestRobotTester):
-    pr.run_and_assert_assert_pytest_result("--collect-only", exit_code=ExitCode.NO_TESTS_COLLECTED)
+    pr.run_and_assert_assert_pytest_result(
+        "--collect-only", subprocess=False, exit_code=ExitCode.NO_TESTS_COLLECTED
+    )
 
 
 def test_class_three_tests_one_fail(pr: PytestRobotTester):
@@ -918,7 +943,9 @@ Log URI: {re.escape(path.as_uri())}
 
 
 def test_console_summary_collect_only(pr: PytestRobotTester):
-    result = pr.run_pytest("--robot-outputdir=a", "--robot-log=b", "--collect-only")
+    result = pr.run_pytest(
+        "--robot-outputdir=a", "--robot-log=b", "--collect-only", subprocess=False
+    )
     assert "Robot Framework Log File" not in "\n".join(result.outlines)
 
 
@@ -955,7 +982,7 @@ def test_exitfirst(pr: PytestRobotTester):
         skip(
             "--exitfirst doesn't work with xdist. https://github.com/pytest-dev/pytest-xdist/issues/420"
         )
-    pr.run_and_assert_result("-x", failed=1, skipped=1)
+    pr.run_and_assert_result("-x", "--robot-log=", "--robot-report=", failed=1, skipped=1)
 
 
 def test_maxfail(pr: PytestRobotTester):
@@ -963,4 +990,4 @@ def test_maxfail(pr: PytestRobotTester):
         skip(
             "--maxfail doesn't work with xdist. https://github.com/pytest-dev/pytest-xdist/issues/868"
         )
-    pr.run_and_assert_result("--maxfail=2", failed=2, skipped=1)
+    pr.run_and_assert_result("--maxfail=2", "--robot-log=", "--robot-report=", failed=2, skipped=1)
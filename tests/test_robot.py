@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Optional, cast
 from pytest import ExitCode, Item, Mark
 
 from pytest_robotframework._internal.robot.utils import robot_6
-from tests.conftest import PytestRobotTester, assert_robot_total_stats, output_xml, xpath
+from tests.conftest import PytestRobotTester, assert_robot_total_stats, exists, output_xml, xpath
 
 if TYPE_CHECKING:
     from pytest import Session
@@ -25,15 +25,15 @@ def test_one_test_fails(pr: PytestRobotTester):
 def test_one_test_skipped(pr: PytestRobotTester):
     pr.run_and_assert_result(skipped=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath("./suite//test[@name='Foo']/kw/msg[@level='SKIP']")
+    assert exists(output_xml(), "./suite//test[@name='Foo']/kw/msg[@level='SKIP']")
 
 
 def test_two_tests_one_fail_one_pass(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1, failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("./suite//test[@name='Foo']//kw/msg[@level='INFO' and .='1']")
-    assert xml.xpath("./suite//test[@name='Bar']//kw/msg[@level='FAIL' and .='2']")
+    assert exists(xml, "./suite//test[@name='Foo']//kw/msg[@level='INFO' and .='1']")
+    assert exists(xml, "./suite//test[@name='Bar']//kw/msg[@level='FAIL' and .='2']")
 
 
 def test_listener_calls_log_file(pr: PytestRobotTester):
@@ -49,8 +49,9 @@ def test_listener_calls_log_file(pr: PytestRobotTester):
 def test_setup_passes(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
-        "./suite//test[@name='Foo']/kw[@type='SETUP']/kw[@name='Bar']/kw[@name='Log']/arg[.='2']"
+    assert exists(
+        output_xml(),
+        "./suite//test[@name='Foo']/kw[@type='SETUP']/kw[@name='Bar']/kw[@name='Log']/arg[.='2']",
     )
 
 
@@ -58,30 +59,33 @@ def test_setup_fails(pr: PytestRobotTester):
     pr.run_and_assert_result(errors=1, exit_code=ExitCode.TESTS_FAILED)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         "//suite//test[@name='Foo']/kw[@type='SETUP']/kw[@name='Bar' and"
-        " .//msg[@level='FAIL' and .='asdf'] and .//status[@status='FAIL']]"
+        " .//msg[@level='FAIL' and .='asdf'] and .//status[@status='FAIL']]",
     )
     # make sure the test didnt run when setup failed
-    assert not xml.xpath("//kw[contains(@name, 'Run Test')]")
+    assert not exists(xml, "//kw[contains(@name, 'Run Test')]")
 
 
 def test_setup_skipped(pr: PytestRobotTester):
     pr.run_and_assert_result(skipped=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//suite//test[@name='Foo']/kw[@type='SETUP']/kw[@name='Bar' and .//msg[@level='SKIP']]"
+    assert exists(
+        xml,
+        "//suite//test[@name='Foo']/kw[@type='SETUP']/kw[@name='Bar' and .//msg[@level='SKIP']]",
     )
     # make sure the test didnt run when setup was skipped
-    assert not xml.xpath("//kw[contains(@name, 'Run Test')]")
+    assert not exists(xml, "//kw[contains(@name, 'Run Test')]")
 
 
 def test_teardown_passes(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
-    assert output_xml().xpath(
-        "./suite//test[@name='Foo']/kw[@type='TEARDOWN']/kw[@name='Bar']/kw[@name='Log']/arg[.='2']"
+    assert exists(
+        output_xml(),
+        "./suite//test[@name='Foo']/kw[@type='TEARDOWN']/kw[@name='Bar']/kw[@name='Log']/arg[.='2']",
     )
 
 
@@ -91,11 +95,12 @@ def test_teardown_fails(pr: PytestRobotTester):
     assert_robot_total_stats(failed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         "//suite//test[@name='Foo']/kw[@type='TEARDOWN']/kw[@name='Bar' and"
-        " .//msg[@level='FAIL' and .='asdf'] and .//status[@status='FAIL']]"
+        " .//msg[@level='FAIL' and .='asdf'] and .//status[@status='FAIL']]",
     )
-    assert xml.xpath("//kw[contains(@name, 'Run Test')]")
+    assert exists(xml, "//kw[contains(@name, 'Run Test')]")
 
 
 def test_teardown_skipped(pr: PytestRobotTester):
@@ -104,20 +109,21 @@ def test_teardown_skipped(pr: PytestRobotTester):
     assert_robot_total_stats(skipped=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//suite//test[@name='Foo']/kw[@type='TEARDOWN']/kw[@name='Bar' and .//msg[@level='SKIP']]"
+    assert exists(
+        xml,
+        "//suite//test[@name='Foo']/kw[@type='TEARDOWN']/kw[@name='Bar' and .//msg[@level='SKIP']]",
     )
-    assert xml.xpath("//kw[contains(@name, 'Run Test')]")
+    assert exists(xml, "//kw[contains(@name, 'Run Test')]")
 
 
 def test_two_files_run_one_test(pr: PytestRobotTester):
     pr.run_and_assert_result("foo.robot::Foo", passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("./suite//test[@name='Foo']/status[@status='PASS']")
-    assert xml.xpath("./suite//test[@name='Foo']/kw/status[@status='PASS']")
-    assert not xml.xpath("./suite//test[@name='Bar']")
-    assert not xml.xpath("./suite//test[@name='Baz']")
+    assert exists(xml, "./suite//test[@name='Foo']/status[@status='PASS']")
+    assert exists(xml, "./suite//test[@name='Foo']/kw/status[@status='PASS']")
+    assert not exists(xml, "./suite//test[@name='Bar']")
+    assert not exists(xml, "./suite//test[@name='Baz']")
 
 
 def test_two_files_run_test_from_second_suite(pr: PytestRobotTester):
@@ -126,10 +132,10 @@ def test_two_files_run_test_from_second_suite(pr: PytestRobotTester):
     pr.run_and_assert_result("fdsa/bar.robot::Baz", passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath("./suite//test[@name='Baz']/status[@status='PASS']")
-    assert xml.xpath("./suite//test[@name='Baz']/kw/status[@status='PASS']")
-    assert not xml.xpath("./suite//test[@name='Foo']")
-    assert not xml.xpath("./suite//test[@name='Bar']")
+    assert exists(xml, "./suite//test[@name='Baz']/status[@status='PASS']")
+    assert exists(xml, "./suite//test[@name='Baz']/kw/status[@status='PASS']")
+    assert not exists(xml, "./suite//test[@name='Foo']")
+    assert not exists(xml, "./suite//test[@name='Bar']")
 
 
 def test_run_two_files(pr: PytestRobotTester):
@@ -141,20 +147,20 @@ def test_tags(pr: PytestRobotTester):
     pr.run_and_assert_result("-m", "m1", passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test[@name='Foo']/tag[.='m1']")
-    assert not xml.xpath(".//test[@name='Bar']")
+    assert exists(xml, ".//test[@name='Foo']/tag[.='m1']")
+    assert not exists(xml, ".//test[@name='Bar']")
 
 
 def test_tags_in_settings(pr: PytestRobotTester):
     pr.run_and_assert_result("-m", "m1", passed=2)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test[@name='Foo']/tag[.='m1']")
-    assert xml.xpath(".//test[@name='Bar']/tag[.='m1']")
+    assert exists(xml, ".//test[@name='Foo']/tag[.='m1']")
+    assert exists(xml, ".//test[@name='Bar']/tag[.='m1']")
 
 
 def test_warning_on_unknown_tag(pr: PytestRobotTester):
-    result = pr.run_pytest("--strict-markers", "-m", "m1")
+    result = pr.run_pytest("--strict-markers", "-m", "m1", "--robot-log=", "--robot-report=")
     result.assert_outcomes(errors=pr.xdist or 1)
     assert result.ret == ExitCode.TESTS_FAILED
     assert "'m1' not found in `markers` configuration option" in result.outlines
@@ -204,8 +210,8 @@ def test_doesnt_run_tests_outside_path(pr: PytestRobotTester):
     pr.run_and_assert_result("foo", passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(".//test[@name='Foo']")
-    assert not xml.xpath(".//test[@name='Bar']")
+    assert exists(xml, ".//test[@name='Foo']")
+    assert not exists(xml, ".//test[@name='Bar']")
 
 
 def test_run_keyword_and_ignore_error(pr: PytestRobotTester):
@@ -230,9 +236,10 @@ def test_setup_with_args(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
+    assert exists(
+        xml,
         "//kw[@type='SETUP']/kw[@name='Run Keywords' and ./arg[.='Bar'] and"
-        " ./arg[.='AND'] and ./arg[.='Baz']]"
+        " ./arg[.='AND'] and ./arg[.='Baz']]",
     )
 
 
@@ -240,11 +247,11 @@ def test_keyword_with_conflicting_name(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     xml = output_xml()
-    assert xml.xpath(
-        "//kw[@name='Run Test']/kw[@name='Teardown' and not(@type)]/kw[@name='Log']/msg[.='1']"
+    assert exists(
+        xml, "//kw[@name='Run Test']/kw[@name='Teardown' and not(@type)]/kw[@name='Log']/msg[.='1']"
     )
-    assert xml.xpath(
-        "//kw[@type='TEARDOWN']/kw[@name='Actual Teardown']/kw[@name='Log']/msg[.='2']"
+    assert exists(
+        xml, "//kw[@type='TEARDOWN']/kw[@name='Actual Teardown']/kw[@name='Log']/msg[.='2']"
     )
 
 
@@ -256,14 +263,14 @@ def test_keyword_decorator(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     # make sure it doesn't get double keyworded
-    assert output_xml().xpath("//kw[@name='Run Test']/kw[@name='Bar']/msg[.='1']")
+    assert exists(output_xml(), "//kw[@name='Run Test']/kw[@name='Bar']/msg[.='1']")
 
 
 def test_keyword_decorator_and_other_decorator(pr: PytestRobotTester):
     pr.run_and_assert_result(passed=1)
     pr.assert_log_file_exists()
     # make sure it doesn't get double keyworded
-    assert output_xml().xpath("//kw[@name='Run Test']/kw[@name='Bar']/msg[.='1']")
+    assert exists(output_xml(), "//kw[@name='Run Test']/kw[@name='Bar']/msg[.='1']")
 
 
 def test_line_number(pr: PytestRobotTester):
@@ -297,12 +304,14 @@ def test_nested_keyword_that_fails(pr: PytestRobotTester):
 
 
 def test_fails_when_import_error_and_exit_on_error(pr: PytestRobotTester):
-    pr.run_and_assert_assert_pytest_result("--robot-exitonerror", exit_code=ExitCode.INTERNAL_ERROR)
+    pr.run_and_assert_assert_pytest_result(
+        "--robot-exitonerror", "--robot-log=", "--robot-report=", exit_code=ExitCode.INTERNAL_ERROR
+    )
     assert_robot_total_stats(failed=1)
 
 
 def test_traceback(pr: PytestRobotTester):
-    result = pr.run_pytest("--tb=short")
+    result = pr.run_pytest("--tb=short", "--robot-log=", "--robot-report=")
     assert """
 util.py:5: in thing
     raise Exception("asdf")
@@ -324,8 +333,8 @@ def test_empty_setup_or_teardown(pr: PytestRobotTester):
         "//test[@name='Runs globally defined setup and teardown']/kw[@name='Teardown']"
         "/kw[@name='Log']/msg[.='teardown ran']",
     )
-    assert not xml.xpath("//test[@name='Disable setup']/kw[@name='Setup']/kw[@name='Log']")
-    assert not xml.xpath("//test[@name='Disable teardown']/kw[@name='Teardown']/kw[@name='Log']")
+    assert not exists(xml, "//test[@name='Disable setup']/kw[@name='Setup']/kw[@name='Log']")
+    assert not exists(xml, "//test[@name='Disable teardown']/kw[@name='Teardown']/kw[@name='Log']")
 
 
 def test_keyword_decorator_class_library(pr: PytestRobotTester):